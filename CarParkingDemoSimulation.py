@@ -1,653 +1,1041 @@
-"""
-Urban City Parking Management System - Enhanced Demonstration
-This script simulates realistic scenarios with proper time durations
-"""
-
-from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Optional, Dict
-import uuid
-
-
-# ============== VEHICLE CLASSES ==============
-
-class Vehicle(ABC):
-    """Abstract Base Class for all vehicle types."""
-    
-    def __init__(self, registration_number: str):
-        self._registration_number = registration_number
-    
-    @abstractmethod
-    def get_space_requirement(self) -> int:
-        pass
-    
-    @abstractmethod
-    def get_vehicle_type(self) -> str:
-        pass
-    
-    def get_registration(self) -> str:
-        return self._registration_number
-
-
-class Car(Vehicle):
-    def get_space_requirement(self) -> int:
-        return 1
-    
-    def get_vehicle_type(self) -> str:
-        return "Car"
-
-
-class Motorcycle(Vehicle):
-    def get_space_requirement(self) -> int:
-        return 1
-    
-    def get_vehicle_type(self) -> str:
-        return "Motorcycle"
-
-
-class Truck(Vehicle):
-    def get_space_requirement(self) -> int:
-        return 2
-    
-    def get_vehicle_type(self) -> str:
-        return "Truck"
-
-
-# ============== PARKING PASS CLASSES ==============
-
-class ParkingPass(ABC):
-    """Abstract Base Class for parking passes."""
-    
-    def __init__(self, pass_id: str, holder_name: str, vehicle_registration: str):
-        self._pass_id = pass_id
-        self._holder_name = holder_name
-        self._vehicle_registration = vehicle_registration
-        self._issue_date = datetime.now()
-    
-    @abstractmethod
-    def is_valid(self) -> bool:
-        pass
-    
-    @abstractmethod
-    def get_pass_type(self) -> str:
-        pass
-    
-    def use_pass(self) -> bool:
-        return True
-    
-    @property
-    def pass_id(self) -> str:
-        return self._pass_id
-    
-    @property
-    def holder_name(self) -> str:
-        return self._holder_name
-    
-    @property
-    def vehicle_registration(self) -> str:
-        return self._vehicle_registration
-
-
-class MonthlyPass(ParkingPass):
-    def __init__(self, pass_id: str, holder_name: str, 
-                 vehicle_registration: str, expiry_date: datetime):
-        super().__init__(pass_id, holder_name, vehicle_registration)
-        self._expiry_date = expiry_date
-    
-    def is_valid(self) -> bool:
-        return datetime.now() < self._expiry_date
-    
-    def get_pass_type(self) -> str:
-        return "Monthly Pass"
-    
-    def days_remaining(self) -> int:
-        if not self.is_valid():
-            return 0
-        delta = self._expiry_date - datetime.now()
-        return delta.days
-    
-    @property
-    def expiry_date(self) -> datetime:
-        return self._expiry_date
-
-
-class SingleEntryPass(ParkingPass):
-    FLAT_RATE = 10.00
-    
-    def __init__(self, pass_id: str, holder_name: str, vehicle_registration: str):
-        super().__init__(pass_id, holder_name, vehicle_registration)
-        self._is_used = False
-    
-    def is_valid(self) -> bool:
-        return not self._is_used
-    
-    def get_pass_type(self) -> str:
-        return "Single Entry Pass"
-    
-    def use_pass(self) -> bool:
-        if self._is_used:
-            return False
-        self._is_used = True
-        return True
-
-
-# ============== PRICING STRATEGY CLASSES ==============
-
-class PricingStrategy(ABC):
-    """Abstract Base Class for pricing strategies."""
-    
-    def __init__(self):
-        self._base_rates = {}
-    
-    @abstractmethod
-    def get_hourly_rate(self, vehicle_type: str) -> float:
-        pass
-    
-    @abstractmethod
-    def get_strategy_name(self) -> str:
-        pass
-    
-    def calculate_fee(self, vehicle_type: str, duration_hours: float) -> float:
-        hourly_rate = self.get_hourly_rate(vehicle_type)
-        return round(hourly_rate * duration_hours, 2)
-
-
-class StandardPricing(PricingStrategy):
-    def __init__(self):
-        super().__init__()
-        self._base_rates = {"Car": 2.00, "Motorcycle": 1.00, "Truck": 3.00}
-    
-    def get_hourly_rate(self, vehicle_type: str) -> float:
-        return self._base_rates.get(vehicle_type, 2.00)
-    
-    def get_strategy_name(self) -> str:
-        return "Standard"
-
-
-class PeakPricing(PricingStrategy):
-    def __init__(self):
-        super().__init__()
-        self._base_rates = {"Car": 4.00, "Motorcycle": 2.00, "Truck": 6.00}
-    
-    def get_hourly_rate(self, vehicle_type: str) -> float:
-        return self._base_rates.get(vehicle_type, 4.00)
-    
-    def get_strategy_name(self) -> str:
-        return "Peak Hours"
-
-
-class WeekendPricing(PricingStrategy):
-    def __init__(self):
-        super().__init__()
-        self._base_rates = {"Car": 1.50, "Motorcycle": 0.75, "Truck": 2.25}
-    
-    def get_hourly_rate(self, vehicle_type: str) -> float:
-        return self._base_rates.get(vehicle_type, 1.50)
-    
-    def get_strategy_name(self) -> str:
-        return "Weekend"
-
-
-# ============== PARKING TICKET CLASS ==============
-
-class ParkingTicket:
-    """Represents a parking session from entry to exit."""
-    
-    def __init__(self, ticket_id: str, vehicle: Vehicle, entry_time: datetime):
-        self._ticket_id = ticket_id
-        self._vehicle = vehicle
-        self._entry_time = entry_time
-        self._exit_time: Optional[datetime] = None
-        self._parking_pass: Optional[ParkingPass] = None
-        self._fee_charged: float = 0.0
-        self._spaces_used: int = vehicle.get_space_requirement()
-    
-    def get_duration_hours(self, custom_exit_time: datetime = None) -> float:
-        end_time = custom_exit_time or self._exit_time or datetime.now()
-        duration = end_time - self._entry_time
-        hours = duration.total_seconds() / 3600
-        return round(hours, 2)
-    
-    def set_exit_time(self, exit_time: datetime) -> None:
-        self._exit_time = exit_time
-    
-    def apply_pass(self, parking_pass: ParkingPass) -> bool:
-        if parking_pass.vehicle_registration != self._vehicle.get_registration():
-            return False
-        self._parking_pass = parking_pass
-        return True
-    
-    def calculate_fee(self, strategy: PricingStrategy, duration_hours: float = None) -> float:
-        if self._parking_pass and isinstance(self._parking_pass, MonthlyPass):
-            if self._parking_pass.is_valid():
-                self._fee_charged = 0.0
-                return self._fee_charged
-        
-        if self._parking_pass and isinstance(self._parking_pass, SingleEntryPass):
-            if self._parking_pass.is_valid():
-                self._parking_pass.use_pass()
-                self._fee_charged = SingleEntryPass.FLAT_RATE
-                return self._fee_charged
-        
-        duration = duration_hours if duration_hours else self.get_duration_hours()
-        vehicle_type = self._vehicle.get_vehicle_type()
-        self._fee_charged = strategy.calculate_fee(vehicle_type, duration)
-        return self._fee_charged
-    
-    @property
-    def ticket_id(self) -> str:
-        return self._ticket_id
-    
-    @property
-    def vehicle(self) -> Vehicle:
-        return self._vehicle
-    
-    @property
-    def entry_time(self) -> datetime:
-        return self._entry_time
-    
-    @property
-    def exit_time(self) -> Optional[datetime]:
-        return self._exit_time
-    
-    @property
-    def parking_pass(self) -> Optional[ParkingPass]:
-        return self._parking_pass
-    
-    @property
-    def fee_charged(self) -> float:
-        return self._fee_charged
-    
-    @property
-    def spaces_used(self) -> int:
-        return self._spaces_used
-
-
-# ============== PARKING LOT CLASS ==============
-
-class ParkingLot:
-    """Main controller class for the parking management system."""
-    
-    def __init__(self, total_spaces: int = 300):
-        self.__total_spaces = total_spaces
-        self.__occupied_spaces = 0
-        self.__active_tickets: Dict[str, ParkingTicket] = {}
-        self.__passes: Dict[str, ParkingPass] = {}
-        self.__pricing_strategy: PricingStrategy = StandardPricing()
-        self.__ticket_counter = 0
-        self.__pass_counter = {"monthly": 0, "single": 0}
-    
-    def _generate_ticket_id(self) -> str:
-        self.__ticket_counter += 1
-        return f"TKT-{self.__ticket_counter:04d}"
-    
-    def _generate_pass_id(self, pass_type: str) -> str:
-        if pass_type == "monthly":
-            self.__pass_counter["monthly"] += 1
-            return f"MP-{self.__pass_counter['monthly']:04d}"
-        else:
-            self.__pass_counter["single"] += 1
-            return f"SP-{self.__pass_counter['single']:04d}"
-    
-    def get_available_spaces(self) -> int:
-        return self.__total_spaces - self.__occupied_spaces
-    
-    def set_occupied_spaces(self, count: int) -> None:
-        """For simulation purposes - set occupied spaces directly."""
-        self.__occupied_spaces = min(count, self.__total_spaces)
-    
-    def vehicle_entry(self, vehicle: Vehicle, pass_id: Optional[str] = None,
-                      entry_time: datetime = None, pricing_strategy: PricingStrategy = None) -> Optional[ParkingTicket]:
-        """Processes vehicle entry with optional custom entry time for simulation."""
-        
-        spaces_needed = vehicle.get_space_requirement()
-        
-        if self.get_available_spaces() < spaces_needed:
-            print(f"\n{'='*45}")
-            print("            ENTRY DENIED")
-            print(f"{'='*45}")
-            print(f"Vehicle: {vehicle.get_registration()} ({vehicle.get_vehicle_type()})")
-            print("Reason: PARKING LOT FULL")
-            print(f"Required Spaces: {spaces_needed}")
-            print(f"Available Spaces: {self.get_available_spaces()}")
-            print("-" * 45)
-            print("Please try again later.")
-            print(f"{'='*45}\n")
-            return None
-        
-        ticket_id = self._generate_ticket_id()
-        actual_entry_time = entry_time if entry_time else datetime.now()
-        ticket = ParkingTicket(ticket_id, vehicle, actual_entry_time)
-        
-        pass_applied = False
-        parking_pass = None
-        if pass_id and pass_id in self.__passes:
-            parking_pass = self.__passes[pass_id]
-            if parking_pass.is_valid():
-                if ticket.apply_pass(parking_pass):
-                    pass_applied = True
-        
-        self.__occupied_spaces += spaces_needed
-        self.__active_tickets[ticket_id] = ticket
-        
-        strategy = pricing_strategy if pricing_strategy else self.__pricing_strategy
-        
-        print(f"\n{'='*45}")
-        print("            PARKING TICKET")
-        print(f"{'='*45}")
-        print(f"Ticket ID: {ticket_id}")
-        print(f"Vehicle: {vehicle.get_registration()} ({vehicle.get_vehicle_type()})")
-        print(f"Entry Time: {actual_entry_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Spaces Allocated: {spaces_needed}")
-        print(f"Available Spaces: {self.get_available_spaces()}")
-        
-        if pass_applied and parking_pass:
-            print("-" * 45)
-            print(f"Pass Applied: {parking_pass.get_pass_type()} ({pass_id})")
-            print(f"Pass Holder: {parking_pass.holder_name}")
-            if isinstance(parking_pass, MonthlyPass):
-                print(f"Days Remaining: {parking_pass.days_remaining()}")
-                print("FEE WAIVED - Monthly Pass Holder")
-            elif isinstance(parking_pass, SingleEntryPass):
-                print(f"Flat Rate: ${SingleEntryPass.FLAT_RATE:.2f}")
-        elif pass_id:
-            print("-" * 45)
-            print(f"WARNING: Pass ID '{pass_id}' not found")
-            print("         or invalid. Standard rates apply.")
-        
-        print("-" * 45)
-        print(f"Pricing: {strategy.get_strategy_name()} Rate")
-        print(f"{'='*45}\n")
-        
-        return ticket
-    
-    def vehicle_exit(self, ticket_id: str, exit_time: datetime = None,
-                     pricing_strategy: PricingStrategy = None, 
-                     simulated_duration: float = None) -> Optional[Dict]:
-        """Processes vehicle exit with optional custom exit time for simulation."""
-        
-        if ticket_id not in self.__active_tickets:
-            print(f"\nError: Ticket '{ticket_id}' not found.")
-            return None
-        
-        ticket = self.__active_tickets[ticket_id]
-        actual_exit_time = exit_time if exit_time else datetime.now()
-        ticket.set_exit_time(actual_exit_time)
-        
-        strategy = pricing_strategy if pricing_strategy else self.__pricing_strategy
-        
-        # Use simulated duration if provided
-        if simulated_duration:
-            duration = simulated_duration
-        else:
-            duration = ticket.get_duration_hours(actual_exit_time)
-        
-        fee = ticket.calculate_fee(strategy, duration)
-        
-        self.__occupied_spaces -= ticket.spaces_used
-        del self.__active_tickets[ticket_id]
-        
-        exit_details = {
-            "ticket_id": ticket_id,
-            "vehicle_reg": ticket.vehicle.get_registration(),
-            "vehicle_type": ticket.vehicle.get_vehicle_type(),
-            "entry_time": ticket.entry_time,
-            "exit_time": actual_exit_time,
-            "duration_hours": duration,
-            "pricing_strategy": strategy.get_strategy_name(),
-            "hourly_rate": strategy.get_hourly_rate(ticket.vehicle.get_vehicle_type()),
-            "total_fee": fee,
-            "pass_type": ticket.parking_pass.get_pass_type() if ticket.parking_pass else None,
-            "pass_id": ticket.parking_pass.pass_id if ticket.parking_pass else None
-        }
-        
-        print(f"\n{'='*45}")
-        print("            EXIT RECEIPT")
-        print(f"{'='*45}")
-        print(f"Ticket ID: {ticket_id}")
-        print(f"Vehicle: {exit_details['vehicle_reg']} ({exit_details['vehicle_type']})")
-        print(f"Entry Time: {exit_details['entry_time'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Exit Time: {exit_details['exit_time'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Duration: {exit_details['duration_hours']} hours")
-        print("-" * 45)
-        
-        if ticket.parking_pass:
-            print(f"Pass Type: {exit_details['pass_type']}")
-            print(f"Pass ID: {exit_details['pass_id']}")
-            if isinstance(ticket.parking_pass, SingleEntryPass):
-                print("Pass Status: CONSUMED")
-            print("-" * 45)
-            if isinstance(ticket.parking_pass, MonthlyPass):
-                print(f"TOTAL FEE: $0.00 (Pass Holder)")
-            else:
-                print(f"TOTAL FEE: ${fee:.2f} (Flat Rate)")
-        else:
-            print(f"Pricing Strategy: {exit_details['pricing_strategy']}")
-            print(f"Hourly Rate: ${exit_details['hourly_rate']:.2f}")
-            print("-" * 45)
-            print(f"TOTAL FEE: ${fee:.2f}")
-        
-        print(f"{'='*45}")
-        print(f"Spaces Released: {ticket.spaces_used}")
-        print(f"Current Availability: {self.get_available_spaces()}/{self.__total_spaces}")
-        print(f"{'='*45}\n")
-        
-        return exit_details
-    
-    def issue_monthly_pass(self, holder_name: str, vehicle_registration: str, 
-                           months: int = 1) -> MonthlyPass:
-        pass_id = self._generate_pass_id("monthly")
-        expiry_date = datetime.now() + timedelta(days=30 * months)
-        
-        monthly_pass = MonthlyPass(pass_id, holder_name, vehicle_registration, expiry_date)
-        self.__passes[pass_id] = monthly_pass
-        
-        print(f"\n{'='*45}")
-        print("        MONTHLY PASS ISSUED")
-        print(f"{'='*45}")
-        print(f"Pass ID: {pass_id}")
-        print(f"Holder: {holder_name}")
-        print(f"Vehicle: {vehicle_registration}")
-        print(f"Issue Date: {datetime.now().strftime('%Y-%m-%d')}")
-        print(f"Expiry Date: {expiry_date.strftime('%Y-%m-%d')}")
-        print(f"Days Valid: {monthly_pass.days_remaining()}")
-        print("Status: ACTIVE")
-        print(f"{'='*45}\n")
-        
-        return monthly_pass
-    
-    def issue_single_pass(self, holder_name: str, vehicle_registration: str) -> SingleEntryPass:
-        pass_id = self._generate_pass_id("single")
-        
-        single_pass = SingleEntryPass(pass_id, holder_name, vehicle_registration)
-        self.__passes[pass_id] = single_pass
-        
-        print(f"\n{'='*45}")
-        print("       SINGLE ENTRY PASS ISSUED")
-        print(f"{'='*45}")
-        print(f"Pass ID: {pass_id}")
-        print(f"Holder: {holder_name}")
-        print(f"Vehicle: {vehicle_registration}")
-        print("Status: VALID (Single Use)")
-        print(f"Flat Rate: ${SingleEntryPass.FLAT_RATE:.2f}")
-        print(f"{'='*45}\n")
-        
-        return single_pass
-    
-    def get_status(self) -> Dict:
-        return {
-            "total_spaces": self.__total_spaces,
-            "occupied_spaces": self.__occupied_spaces,
-            "available_spaces": self.get_available_spaces(),
-            "active_tickets": len(self.__active_tickets),
-            "registered_passes": len(self.__passes)
-        }
-
-
-# ============== ENHANCED DEMONSTRATION ==============
-
-def main():
-    print("\n" + "=" * 65)
-    print("     URBAN CITY PARKING MANAGEMENT SYSTEM - DEMONSTRATION")
-    print("              (Enhanced with Simulated Time Durations)")
-    print("=" * 65)
-    
-    parking_lot = ParkingLot(300)
-    
-    status = parking_lot.get_status()
-    print(f"\nInitial Status:")
-    print(f"  Total Spaces: {status['total_spaces']}")
-    print(f"  Available: {status['available_spaces']}")
-    
-    # ===== 5.1: Vehicle Entry (No Pass) =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.1: Vehicle Entry (No Pass)")
-    print("-" * 65)
-    
-    car1 = Car("ABC-1234")
-    entry_time_1 = datetime(2025, 1, 15, 9, 30, 0)  # Wednesday 9:30 AM
-    ticket1 = parking_lot.vehicle_entry(car1, entry_time=entry_time_1, 
-                                         pricing_strategy=StandardPricing())
-    
-    # ===== 5.2: Vehicle Exit with Fee Calculation =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.2: Vehicle Exit with Fee Calculation (3.5 hours)")
-    print("-" * 65)
-    
-    exit_time_1 = datetime(2025, 1, 15, 13, 0, 0)  # Wednesday 1:00 PM
-    parking_lot.vehicle_exit(ticket1.ticket_id, exit_time=exit_time_1,
-                             pricing_strategy=StandardPricing(),
-                             simulated_duration=3.5)
-    
-    # ===== 5.3: Monthly Pass Issuance =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.3: Monthly Pass Issuance")
-    print("-" * 65)
-    
-    monthly_pass = parking_lot.issue_monthly_pass(
-        holder_name="John Smith",
-        vehicle_registration="XYZ-5678",
-        months=1
-    )
-    
-    # ===== 5.4: Entry with Monthly Pass =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.4: Entry with Monthly Pass")
-    print("-" * 65)
-    
-    car2 = Car("XYZ-5678")
-    entry_time_2 = datetime(2025, 1, 15, 14, 0, 0)
-    ticket2 = parking_lot.vehicle_entry(car2, pass_id=monthly_pass.pass_id,
-                                         entry_time=entry_time_2,
-                                         pricing_strategy=StandardPricing())
-    
-    # ===== 5.5: Exit with Monthly Pass =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.5: Exit with Monthly Pass (4.5 hours - Fee Waived)")
-    print("-" * 65)
-    
-    exit_time_2 = datetime(2025, 1, 15, 18, 30, 0)
-    parking_lot.vehicle_exit(ticket2.ticket_id, exit_time=exit_time_2,
-                             pricing_strategy=StandardPricing(),
-                             simulated_duration=4.5)
-    
-    # ===== 5.6: Peak Hour Pricing =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.6: Peak Hour Pricing (Truck, 4 hours during peak)")
-    print("-" * 65)
-    
-    truck = Truck("TRK-9999")
-    entry_time_3 = datetime(2025, 1, 13, 10, 0, 0)  # Monday 10:00 AM (Peak)
-    ticket3 = parking_lot.vehicle_entry(truck, entry_time=entry_time_3,
-                                         pricing_strategy=PeakPricing())
-    
-    exit_time_3 = datetime(2025, 1, 13, 14, 0, 0)  # Monday 2:00 PM
-    parking_lot.vehicle_exit(ticket3.ticket_id, exit_time=exit_time_3,
-                             pricing_strategy=PeakPricing(),
-                             simulated_duration=4.0)
-    
-    # ===== 5.7: Weekend Pricing =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.7: Weekend Pricing (Motorcycle, 5 hours)")
-    print("-" * 65)
-    
-    motorcycle = Motorcycle("MTR-1111")
-    entry_time_4 = datetime(2025, 1, 18, 11, 0, 0)  # Saturday 11:00 AM
-    ticket4 = parking_lot.vehicle_entry(motorcycle, entry_time=entry_time_4,
-                                         pricing_strategy=WeekendPricing())
-    
-    exit_time_4 = datetime(2025, 1, 18, 16, 0, 0)  # Saturday 4:00 PM
-    parking_lot.vehicle_exit(ticket4.ticket_id, exit_time=exit_time_4,
-                             pricing_strategy=WeekendPricing(),
-                             simulated_duration=5.0)
-    
-    # ===== 5.8: Single Entry Pass Usage =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.8: Single Entry Pass Usage (6 hours - Flat Rate)")
-    print("-" * 65)
-    
-    single_pass = parking_lot.issue_single_pass(
-        holder_name="Jane Doe",
-        vehicle_registration="SGL-2222"
-    )
-    
-    car3 = Car("SGL-2222")
-    entry_time_5 = datetime(2025, 1, 15, 8, 0, 0)
-    ticket5 = parking_lot.vehicle_entry(car3, pass_id=single_pass.pass_id,
-                                         entry_time=entry_time_5,
-                                         pricing_strategy=StandardPricing())
-    
-    exit_time_5 = datetime(2025, 1, 15, 14, 0, 0)
-    parking_lot.vehicle_exit(ticket5.ticket_id, exit_time=exit_time_5,
-                             pricing_strategy=StandardPricing(),
-                             simulated_duration=6.0)
-    
-    # ===== 5.9: Parking Lot Full Scenario =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.9: Parking Lot Full (Entry Denied)")
-    print("-" * 65)
-    
-    # Simulate lot being full
-    parking_lot.set_occupied_spaces(300)
-    print(f"[Simulating full parking lot: {parking_lot.get_available_spaces()} spaces available]")
-    
-    car4 = Car("NEW-0001")
-    parking_lot.vehicle_entry(car4, pricing_strategy=StandardPricing())
-    
-    # Reset for next demo
-    parking_lot.set_occupied_spaces(0)
-    
-    # ===== 5.10: Invalid Pass Attempt =====
-    print("\n" + "-" * 65)
-    print("SCENARIO 5.10: Invalid Pass Attempt")
-    print("-" * 65)
-    
-    car5 = Car("INV-0000")
-    entry_time_6 = datetime(2025, 1, 15, 9, 0, 0)
-    ticket6 = parking_lot.vehicle_entry(car5, pass_id="INVALID-001",
-                                         entry_time=entry_time_6,
-                                         pricing_strategy=StandardPricing())
-    
-    exit_time_6 = datetime(2025, 1, 15, 11, 0, 0)
-    parking_lot.vehicle_exit(ticket6.ticket_id, exit_time=exit_time_6,
-                             pricing_strategy=StandardPricing(),
-                             simulated_duration=2.0)
-    
-    # ===== FINAL STATUS =====
-    print("\n" + "-" * 65)
-    print("FINAL STATUS")
-    print("-" * 65)
-    status = parking_lot.get_status()
-    print(f"  Total Spaces: {status['total_spaces']}")
-    print(f"  Occupied: {status['occupied_spaces']}")
-    print(f"  Available: {status['available_spaces']}")
-    print(f"  Active Tickets: {status['active_tickets']}")
-    print(f"  Registered Passes: {status['registered_passes']}")
-    
-    print("\n" + "=" * 65)
-    print("                   DEMONSTRATION COMPLETE")
-    print("=" * 65 + "\n")
-
-
-if __name__ == "__main__":
+"""
+Urban City Parking Management System - Enhanced Demonstration
+This script simulates realistic scenarios with proper time durations
+"""
+
+import sys
+import time
+
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from multiprocessing import Value
+from typing import Callable, Optional, Dict, Tuple
+
+
+# Interned hot-path strings: identity-based dict probes and 'is'
+# comparisons instead of character-by-character equality checks.
+_CAR = sys.intern("Car")
+_MOTORCYCLE = sys.intern("Motorcycle")
+_TRUCK = sys.intern("Truck")
+_STANDARD = sys.intern("Standard")
+_PEAK_HOURS = sys.intern("Peak Hours")
+_WEEKEND = sys.intern("Weekend")
+
+# Receipt banner/separator strings, built once instead of per print.
+_EQ45 = "=" * 45
+_NL_EQ45 = "\n" + _EQ45
+_EQ45_NL = _EQ45 + "\n"
+_DASH45 = "-" * 45
+_EQ65 = "=" * 65
+_DASH65 = "-" * 65
+
+# Precompiled receipt templates: the fixed blocks of each printout are
+# rendered with one format_map pass instead of a dozen separate
+# f-string evaluations. Pass-specific lines are appended between the
+# header and footer blocks before the single stdout write.
+_ENTRY_DENIED_TMPL = (
+    "\n" + _EQ45 + "\n"
+    "            ENTRY DENIED\n"
+    + _EQ45 + "\n"
+    "Vehicle: {reg} ({vt})\n"
+    "Reason: PARKING LOT FULL\n"
+    "Required Spaces: {needed}\n"
+    "Available Spaces: {available}\n"
+    + _DASH45 + "\n"
+    "Please try again later.\n"
+    + _EQ45 + "\n\n"
+)
+
+_ENTRY_HEADER_TMPL = (
+    "\n" + _EQ45 + "\n"
+    "            PARKING TICKET\n"
+    + _EQ45 + "\n"
+    "Ticket ID: {tid}\n"
+    "Vehicle: {reg} ({vt})\n"
+    "Entry Time: {entry}\n"
+    "Spaces Allocated: {needed}\n"
+    "Available Spaces: {available}"
+)
+
+_ENTRY_FOOTER_TMPL = (
+    _DASH45 + "\n"
+    "Pricing: {strategy} Rate\n"
+    + _EQ45_NL
+)
+
+_EXIT_HEADER_TMPL = (
+    "\n" + _EQ45 + "\n"
+    "            EXIT RECEIPT\n"
+    + _EQ45 + "\n"
+    "Ticket ID: {tid}\n"
+    "Vehicle: {reg} ({vt})\n"
+    "Entry Time: {entry}\n"
+    "Exit Time: {exit}\n"
+    "Duration: {hours} hours\n"
+    + _DASH45
+)
+
+_EXIT_STANDARD_FEE_TMPL = (
+    "Pricing Strategy: {strategy}\n"
+    "Hourly Rate: ${rate:.2f}\n"
+    + _DASH45 + "\n"
+    "TOTAL FEE: ${fee:.2f}"
+)
+
+_EXIT_FOOTER_TMPL = (
+    _EQ45 + "\n"
+    "Spaces Released: {spaces}\n"
+    "Current Availability: {available}/{total}\n"
+    + _EQ45_NL
+)
+
+
+# ============== VEHICLE CLASSES ==============
+
+class Vehicle(ABC):
+    """Abstract Base Class for all vehicle types.
+
+    Subclasses declare VEHICLE_TYPE and SPACE_REQUIREMENT as class
+    constants; hot paths read those attributes directly instead of
+    paying a method call per access.
+    """
+
+    VEHICLE_TYPE: str
+    SPACE_REQUIREMENT: int
+
+    __slots__ = ('_registration_number',)
+
+    def __init__(self, registration_number: str):
+        # Interned so pass/vehicle registration checks are pointer
+        # comparisons instead of full string compares.
+        self._registration_number = sys.intern(registration_number)
+
+    def get_space_requirement(self) -> int:
+        return type(self).SPACE_REQUIREMENT
+
+    def get_vehicle_type(self) -> str:
+        return type(self).VEHICLE_TYPE
+
+    def get_registration(self) -> str:
+        return self._registration_number
+
+
+class Car(Vehicle):
+    __slots__ = ()
+
+    VEHICLE_TYPE = _CAR
+    SPACE_REQUIREMENT = 1
+
+
+class Motorcycle(Vehicle):
+    __slots__ = ()
+
+    VEHICLE_TYPE = _MOTORCYCLE
+    SPACE_REQUIREMENT = 1
+
+
+class Truck(Vehicle):
+    __slots__ = ()
+
+    VEHICLE_TYPE = _TRUCK
+    SPACE_REQUIREMENT = 2
+
+
+# ============== PARKING PASS CLASSES ==============
+
+class ParkingPass(ABC):
+    """Abstract Base Class for parking passes.
+
+    PASS_CODE is the coverage code ParkingLot records in its flat
+    ticket mirror so the bulk fee kernel can branch without touching
+    pass objects: 1 waives the fee, 2 charges the flat rate.
+    """
+
+    PASS_CODE: int
+
+    __slots__ = ('_pass_id', '_holder_name', '_vehicle_registration', '_issue_date')
+
+    def __init__(self, pass_id: str, holder_name: str, vehicle_registration: str):
+        self._pass_id = pass_id
+        self._holder_name = holder_name
+        self._vehicle_registration = sys.intern(vehicle_registration)
+        self._issue_date = datetime.now()
+    
+    @abstractmethod
+    def is_valid(self) -> bool:
+        pass
+    
+    @abstractmethod
+    def get_pass_type(self) -> str:
+        pass
+
+    @abstractmethod
+    def compute_fee(self, strategy: 'PricingStrategy', vehicle_type: str,
+                    duration_hours: float) -> Optional[float]:
+        """Returns the fee this pass covers, or None if the pass cannot
+        be applied and normal strategy pricing should be used."""
+        pass
+
+    def use_pass(self) -> bool:
+        return True
+
+    def entry_receipt_lines(self) -> list:
+        """Pass-specific lines for the entry ticket printout."""
+        return []
+
+    def exit_status_lines(self) -> list:
+        """Pass-specific status lines for the exit receipt."""
+        return []
+
+    def exit_fee_line(self, fee: float) -> str:
+        return f"TOTAL FEE: ${fee:.2f}"
+    
+    @property
+    def pass_id(self) -> str:
+        return self._pass_id
+    
+    @property
+    def holder_name(self) -> str:
+        return self._holder_name
+    
+    @property
+    def vehicle_registration(self) -> str:
+        return self._vehicle_registration
+
+
+class MonthlyPass(ParkingPass):
+    PASS_CODE = 1
+
+    __slots__ = ('_expiry_date',)
+
+    def __init__(self, pass_id: str, holder_name: str, 
+                 vehicle_registration: str, expiry_date: datetime):
+        super().__init__(pass_id, holder_name, vehicle_registration)
+        self._expiry_date = expiry_date
+    
+    def is_valid(self) -> bool:
+        return datetime.now() < self._expiry_date
+    
+    def get_pass_type(self) -> str:
+        return "Monthly Pass"
+
+    def compute_fee(self, strategy: 'PricingStrategy', vehicle_type: str,
+                    duration_hours: float) -> Optional[float]:
+        if self.is_valid():
+            return 0.0
+        return None
+
+    def entry_receipt_lines(self) -> list:
+        return [f"Days Remaining: {self.days_remaining()}",
+                "FEE WAIVED - Monthly Pass Holder"]
+
+    def exit_fee_line(self, fee: float) -> str:
+        return "TOTAL FEE: $0.00 (Pass Holder)"
+    
+    def days_remaining(self, now: datetime = None) -> int:
+        if now is None:
+            now = datetime.now()
+        if now >= self._expiry_date:
+            return 0
+        delta = self._expiry_date - now
+        return delta.days
+    
+    @property
+    def expiry_date(self) -> datetime:
+        return self._expiry_date
+
+
+class SingleEntryPass(ParkingPass):
+    FLAT_RATE = 10.00
+    PASS_CODE = 2
+
+    __slots__ = ('_is_used',)
+
+    def __init__(self, pass_id: str, holder_name: str, vehicle_registration: str):
+        super().__init__(pass_id, holder_name, vehicle_registration)
+        self._is_used = False
+    
+    def is_valid(self) -> bool:
+        return not self._is_used
+    
+    def get_pass_type(self) -> str:
+        return "Single Entry Pass"
+
+    def compute_fee(self, strategy: 'PricingStrategy', vehicle_type: str,
+                    duration_hours: float) -> Optional[float]:
+        if self.use_pass():
+            return self.FLAT_RATE
+        return None
+
+    def entry_receipt_lines(self) -> list:
+        return [f"Flat Rate: ${self.FLAT_RATE:.2f}"]
+
+    def exit_status_lines(self) -> list:
+        return ["Pass Status: CONSUMED"]
+
+    def exit_fee_line(self, fee: float) -> str:
+        return f"TOTAL FEE: ${fee:.2f} (Flat Rate)"
+
+    def use_pass(self) -> bool:
+        if self._is_used:
+            return False
+        self._is_used = True
+        return True
+
+
+# ============== PRICING STRATEGY CLASSES ==============
+
+# Flat lookup table shared by all strategies: one dict probe per fee
+# instead of a per-instance rates dict behind a polymorphic getter.
+_RATE_TABLE = {
+    (_STANDARD, _CAR): 2.00,
+    (_STANDARD, _MOTORCYCLE): 1.00,
+    (_STANDARD, _TRUCK): 3.00,
+    (_PEAK_HOURS, _CAR): 4.00,
+    (_PEAK_HOURS, _MOTORCYCLE): 2.00,
+    (_PEAK_HOURS, _TRUCK): 6.00,
+    (_WEEKEND, _CAR): 1.50,
+    (_WEEKEND, _MOTORCYCLE): 0.75,
+    (_WEEKEND, _TRUCK): 2.25,
+}
+
+
+def _make_fee_fn(rate: float) -> Callable[[float], float]:
+    """Specializes fee computation for a fixed hourly rate: the hot
+    path becomes a single multiply on the captured scalar."""
+    return lambda hours: round(rate * hours, 2)
+
+
+class PricingStrategy(ABC):
+    """Abstract Base Class for pricing strategies.
+
+    Strategies are stateless, so each concrete class is a singleton:
+    repeated constructions like StandardPricing() return one shared
+    instance instead of allocating a new object every time.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+    @abstractmethod
+    def get_hourly_rate(self, vehicle_type: str) -> float:
+        pass
+
+    @abstractmethod
+    def get_strategy_name(self) -> str:
+        pass
+
+    def calculate_fee(self, vehicle_type: str, duration_hours: float) -> float:
+        hourly_rate = self.get_hourly_rate(vehicle_type)
+        return round(hourly_rate * duration_hours, 2)
+
+
+class StandardPricing(PricingStrategy):
+    def get_hourly_rate(self, vehicle_type: str) -> float:
+        return _RATE_TABLE.get((_STANDARD, vehicle_type), 2.00)
+
+    def get_strategy_name(self) -> str:
+        return _STANDARD
+
+
+class PeakPricing(PricingStrategy):
+    def get_hourly_rate(self, vehicle_type: str) -> float:
+        return _RATE_TABLE.get((_PEAK_HOURS, vehicle_type), 4.00)
+
+    def get_strategy_name(self) -> str:
+        return _PEAK_HOURS
+
+
+class WeekendPricing(PricingStrategy):
+    def get_hourly_rate(self, vehicle_type: str) -> float:
+        return _RATE_TABLE.get((_WEEKEND, vehicle_type), 1.50)
+
+    def get_strategy_name(self) -> str:
+        return _WEEKEND
+
+
+# ============== PARKING TICKET CLASS ==============
+
+class ParkingTicket:
+    """Represents a parking session from entry to exit."""
+
+    __slots__ = ('_ticket_id', '_vehicle', '_entry_time', '_entry_epoch',
+                 '_entry_time_str', '_exit_time', '_exit_epoch',
+                 '_parking_pass', '_fee_charged', '_spaces_used')
+
+    def __init__(self, ticket_id: int, vehicle: Vehicle, entry_time: datetime):
+        self._ticket_id = ticket_id
+        self._vehicle = vehicle
+        self._entry_time = entry_time
+        # Epoch-seconds twin of the entry/exit datetimes: durations
+        # become one float subtract instead of a timedelta round trip.
+        self._entry_epoch = entry_time.timestamp()
+        # Formatted once here; reused by both the entry ticket and the
+        # exit receipt printouts.
+        self._entry_time_str = entry_time.isoformat(sep=' ', timespec='seconds')
+        self._exit_time: Optional[datetime] = None
+        self._exit_epoch: Optional[float] = None
+        self._parking_pass: Optional[ParkingPass] = None
+        self._fee_charged: float = 0.0
+        self._spaces_used: int = vehicle.SPACE_REQUIREMENT
+    
+    def duration_at_epoch(self, exit_epoch: float) -> float:
+        """Duration in hours up to a known epoch timestamp."""
+        return round((exit_epoch - self._entry_epoch) / 3600, 2)
+
+    def duration_at(self, exit_time: datetime) -> float:
+        """Duration in hours up to a known exit time; no fallback
+        branches, for callers that always supply the time."""
+        return self.duration_at_epoch(exit_time.timestamp())
+
+    def get_duration_hours(self, custom_exit_time: datetime = None) -> float:
+        if custom_exit_time is not None:
+            end_epoch = custom_exit_time.timestamp()
+        elif self._exit_epoch is not None:
+            end_epoch = self._exit_epoch
+        else:
+            end_epoch = time.time()
+        return self.duration_at_epoch(end_epoch)
+    
+    def set_exit_time(self, exit_time: datetime) -> None:
+        self._exit_time = exit_time
+        self._exit_epoch = exit_time.timestamp()
+    
+    def apply_pass(self, parking_pass: ParkingPass) -> bool:
+        # Both registrations are interned at construction, so identity
+        # comparison suffices here.
+        if parking_pass._vehicle_registration is not self._vehicle._registration_number:
+            return False
+        self._parking_pass = parking_pass
+        return True
+    
+    def calculate_fee(self, strategy: PricingStrategy, duration_hours: float = None,
+                      fee_fn: Callable[[float], float] = None) -> float:
+        vehicle_type = self._vehicle.VEHICLE_TYPE
+        if self._parking_pass is not None:
+            pass_fee = self._parking_pass.compute_fee(strategy, vehicle_type,
+                                                      duration_hours)
+            if pass_fee is not None:
+                self._fee_charged = pass_fee
+                return self._fee_charged
+
+        duration = duration_hours if duration_hours else self.get_duration_hours()
+        if fee_fn is not None:
+            self._fee_charged = fee_fn(duration)
+        else:
+            self._fee_charged = strategy.calculate_fee(vehicle_type, duration)
+        return self._fee_charged
+    
+    @property
+    def ticket_id(self) -> int:
+        return self._ticket_id
+    
+    @property
+    def vehicle(self) -> Vehicle:
+        return self._vehicle
+    
+    @property
+    def entry_time(self) -> datetime:
+        return self._entry_time
+
+    @property
+    def entry_epoch(self) -> float:
+        return self._entry_epoch
+
+    @property
+    def entry_time_str(self) -> str:
+        return self._entry_time_str
+    
+    @property
+    def exit_time(self) -> Optional[datetime]:
+        return self._exit_time
+    
+    @property
+    def parking_pass(self) -> Optional[ParkingPass]:
+        return self._parking_pass
+    
+    @property
+    def fee_charged(self) -> float:
+        return self._fee_charged
+    
+    @property
+    def spaces_used(self) -> int:
+        return self._spaces_used
+
+
+# ============== PARKING LOT CLASS ==============
+
+@dataclass(slots=True, frozen=True)
+class ExitDetails:
+    """Fixed-slot record returned by ParkingLot.vehicle_exit."""
+    ticket_id: str
+    vehicle_reg: str
+    vehicle_type: str
+    entry_time: datetime
+    exit_time: datetime
+    duration_hours: float
+    pricing_strategy: str
+    hourly_rate: float
+    total_fee: float
+    pass_type: Optional[str]
+    pass_id: Optional[str]
+
+
+
+# Compact vehicle-type codes used by the flat ticket arrays below.
+_VEHICLE_TYPE_CODES = {_CAR: 0, _MOTORCYCLE: 1, _TRUCK: 2}
+_VEHICLE_TYPES_BY_CODE = (_CAR, _MOTORCYCLE, _TRUCK)
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _bulk_fees_kernel(entry_epochs, now_epoch, vt_codes, pass_codes,
+                      rates, flat_rate, out):
+    """Prices every ticket slot, honoring pass coverage.
+
+    pass_codes follows ParkingPass.PASS_CODE: 0 prices rate * hours
+    parked, 1 (monthly) waives the fee, 2 (single entry) charges the
+    flat rate. Pure arithmetic over flat buffers so numba can compile
+    it when installed; without numba it runs as a plain Python loop.
+    """
+    for i in range(len(out)):
+        pass_code = pass_codes[i]
+        if pass_code == 1:
+            out[i] = 0.0
+        elif pass_code == 2:
+            out[i] = flat_rate
+        else:
+            out[i] = rates[vt_codes[i]] * (now_epoch - entry_epochs[i]) / 3600.0
+
+
+if njit is not None:
+    _bulk_fees_kernel = njit(cache=True)(_bulk_fees_kernel)
+
+
+class ParkingLot:
+    """Main controller class for the parking management system."""
+
+    def __init__(self, total_spaces: int = 300):
+        self._total_spaces = total_spaces
+        # Shared atomic counter: capacity checks and updates happen as
+        # one check-and-reserve operation, so concurrent entry/exit
+        # workers cannot oversubscribe the lot.
+        self._occupied_spaces = Value('i', 0)
+        self._active_tickets: Dict[int, ParkingTicket] = {}
+        self._passes: Dict[str, ParkingPass] = {}
+        self._pricing_strategy: PricingStrategy = StandardPricing()
+        self._ticket_counter = 0
+        self._pass_counter = {"monthly": 0, "single": 0}
+        # Fee closures specialized per (strategy name, vehicle type),
+        # built lazily on first use.
+        self._fee_fns: Dict[Tuple[str, str], Callable[[float], float]] = {}
+        # Structure-of-arrays mirror of the active tickets: flat,
+        # densely typed columns that bulk reporting can sweep without
+        # touching one ParkingTicket object per row. Exited tickets
+        # leave holes that are recycled via a free list.
+        self._ticket_slots: Dict[int, int] = {}
+        self._slot_entry_epochs = array('d')
+        self._slot_vt_codes = array('b')
+        self._slot_spaces = array('b')
+        self._slot_pass_codes = array('b')
+        self._free_slots: list = []
+
+    def _store_ticket_slot(self, ticket_id: int, entry_epoch: float,
+                           vehicle: Vehicle, pass_code: int) -> None:
+        vt_code = _VEHICLE_TYPE_CODES[vehicle.VEHICLE_TYPE]
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_entry_epochs[slot] = entry_epoch
+            self._slot_vt_codes[slot] = vt_code
+            self._slot_spaces[slot] = vehicle.SPACE_REQUIREMENT
+            self._slot_pass_codes[slot] = pass_code
+        else:
+            slot = len(self._slot_entry_epochs)
+            self._slot_entry_epochs.append(entry_epoch)
+            self._slot_vt_codes.append(vt_code)
+            self._slot_spaces.append(vehicle.SPACE_REQUIREMENT)
+            self._slot_pass_codes.append(pass_code)
+        self._ticket_slots[ticket_id] = slot
+
+    def _release_ticket_slot(self, ticket_id: int) -> None:
+        slot = self._ticket_slots.pop(ticket_id, None)
+        if slot is not None:
+            self._free_slots.append(slot)
+
+    def bulk_calculate_fees(self, now: datetime = None,
+                            pricing_strategy: PricingStrategy = None) -> Dict[int, float]:
+        """Computes would-be fees for every active ticket in one sweep.
+
+        Runs over the flat ticket columns rather than the ticket
+        objects, so the cost per ticket is a float subtract and a
+        table lookup. Pass coverage is honored as recorded at entry:
+        monthly-pass tickets price at $0.00 and single-entry-pass
+        tickets at the flat rate, matching what vehicle_exit would
+        charge.
+        """
+        now_epoch = (now if now else datetime.now()).timestamp()
+        strategy = pricing_strategy if pricing_strategy else self._pricing_strategy
+        strategy_name = strategy.get_strategy_name()
+        rates = array('d', (_RATE_TABLE.get((strategy_name, vt), 0.0)
+                            for vt in _VEHICLE_TYPES_BY_CODE))
+        out = array('d', bytes(8 * len(self._slot_entry_epochs)))
+        _bulk_fees_kernel(self._slot_entry_epochs, now_epoch,
+                          self._slot_vt_codes, self._slot_pass_codes,
+                          rates, SingleEntryPass.FLAT_RATE, out)
+        return {ticket_id: round(out[slot], 2)
+                for ticket_id, slot in self._ticket_slots.items()}
+    
+    def _generate_ticket_id(self) -> int:
+        self._ticket_counter += 1
+        return self._ticket_counter
+
+    @staticmethod
+    def _format_ticket_id(ticket_id: int) -> str:
+        """Formats the display form of a ticket ID only when printing."""
+        return f"TKT-{ticket_id:04d}"
+    
+    def _generate_pass_id(self, pass_type: str) -> str:
+        if pass_type == "monthly":
+            self._pass_counter["monthly"] += 1
+            return f"MP-{self._pass_counter['monthly']:04d}"
+        else:
+            self._pass_counter["single"] += 1
+            return f"SP-{self._pass_counter['single']:04d}"
+    
+    def _get_fee_fn(self, strategy: PricingStrategy,
+                    vehicle_type: str) -> Callable[[float], float]:
+        key = (strategy.get_strategy_name(), vehicle_type)
+        fee_fn = self._fee_fns.get(key)
+        if fee_fn is None:
+            fee_fn = _make_fee_fn(strategy.get_hourly_rate(vehicle_type))
+            self._fee_fns[key] = fee_fn
+        return fee_fn
+
+    def _try_reserve_spaces(self, count: int) -> Tuple[bool, int]:
+        """Atomically reserves count spaces if the lot can fit them.
+
+        Returns (reserved, available): the availability after the
+        reservation on success, or the unchanged availability on
+        failure.
+        """
+        counter = self._occupied_spaces
+        with counter.get_lock():
+            available = self._total_spaces - counter.value
+            if available < count:
+                return False, available
+            counter.value += count
+            return True, available - count
+
+    def _release_spaces(self, count: int) -> int:
+        """Atomically releases count spaces; returns the new availability."""
+        counter = self._occupied_spaces
+        with counter.get_lock():
+            counter.value -= count
+            return self._total_spaces - counter.value
+
+    def get_available_spaces(self) -> int:
+        return self._total_spaces - self._occupied_spaces.value
+    
+    def set_occupied_spaces(self, count: int) -> None:
+        """For simulation purposes - set occupied spaces directly."""
+        counter = self._occupied_spaces
+        with counter.get_lock():
+            counter.value = min(count, self._total_spaces)
+    
+    def vehicle_entry(self, vehicle: Vehicle, pass_id: Optional[str] = None,
+                      entry_time: datetime = None, pricing_strategy: PricingStrategy = None) -> Optional[ParkingTicket]:
+        """Processes vehicle entry with optional custom entry time for simulation."""
+        
+        spaces_needed = vehicle.SPACE_REQUIREMENT
+        reserved, available = self._try_reserve_spaces(spaces_needed)
+
+        if not reserved:
+            sys.stdout.write(_ENTRY_DENIED_TMPL.format_map({
+                'reg': vehicle.get_registration(),
+                'vt': vehicle.VEHICLE_TYPE,
+                'needed': spaces_needed,
+                'available': available,
+            }))
+            return None
+        
+        ticket_id = self._generate_ticket_id()
+        actual_entry_time = entry_time if entry_time else datetime.now()
+        ticket = ParkingTicket(ticket_id, vehicle, actual_entry_time)
+        
+        pass_applied = False
+        parking_pass = self._passes.get(pass_id) if pass_id else None
+        if parking_pass is not None and parking_pass.is_valid():
+            if ticket.apply_pass(parking_pass):
+                pass_applied = True
+        
+        self._active_tickets[ticket_id] = ticket
+        self._store_ticket_slot(ticket_id, ticket.entry_epoch, vehicle,
+                                parking_pass.PASS_CODE if pass_applied else 0)
+
+        strategy = pricing_strategy if pricing_strategy else self._pricing_strategy
+        
+        lines = [_ENTRY_HEADER_TMPL.format_map({
+            'tid': self._format_ticket_id(ticket_id),
+            'reg': vehicle.get_registration(),
+            'vt': vehicle.VEHICLE_TYPE,
+            'entry': ticket.entry_time_str,
+            'needed': spaces_needed,
+            'available': available,
+        })]
+
+        if pass_applied and parking_pass:
+            lines.append(_DASH45)
+            lines.append(f"Pass Applied: {parking_pass.get_pass_type()} ({pass_id})")
+            lines.append(f"Pass Holder: {parking_pass.holder_name}")
+            lines.extend(parking_pass.entry_receipt_lines())
+        elif pass_id:
+            lines.append(_DASH45)
+            lines.append(f"WARNING: Pass ID '{pass_id}' not found")
+            lines.append("         or invalid. Standard rates apply.")
+
+        lines.append(_ENTRY_FOOTER_TMPL.format_map(
+            {'strategy': strategy.get_strategy_name()}))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        return ticket
+    
+    def vehicle_exit(self, ticket_id: int, exit_time: datetime = None,
+                     pricing_strategy: PricingStrategy = None, 
+                     simulated_duration: float = None) -> Optional[ExitDetails]:
+        """Processes vehicle exit with optional custom exit time for simulation."""
+        
+        ticket = self._active_tickets.pop(ticket_id, None)
+        if ticket is None:
+            print(f"\nError: Ticket '{self._format_ticket_id(ticket_id)}' not found.")
+            return None
+
+        actual_exit_time = exit_time if exit_time else datetime.now()
+        ticket.set_exit_time(actual_exit_time)
+        
+        strategy = pricing_strategy if pricing_strategy else self._pricing_strategy
+        
+        # Use simulated duration if provided
+        if simulated_duration:
+            duration = simulated_duration
+        else:
+            duration = ticket.duration_at(actual_exit_time)
+        
+        fee_fn = self._get_fee_fn(strategy, ticket.vehicle.VEHICLE_TYPE)
+        fee = ticket.calculate_fee(strategy, duration, fee_fn)
+        
+        available = self._release_spaces(ticket.spaces_used)
+        self._release_ticket_slot(ticket_id)
+        
+        exit_details = ExitDetails(
+            ticket_id=self._format_ticket_id(ticket_id),
+            vehicle_reg=ticket.vehicle.get_registration(),
+            vehicle_type=ticket.vehicle.VEHICLE_TYPE,
+            entry_time=ticket.entry_time,
+            exit_time=actual_exit_time,
+            duration_hours=duration,
+            pricing_strategy=strategy.get_strategy_name(),
+            hourly_rate=strategy.get_hourly_rate(ticket.vehicle.VEHICLE_TYPE),
+            total_fee=fee,
+            pass_type=ticket.parking_pass.get_pass_type() if ticket.parking_pass else None,
+            pass_id=ticket.parking_pass.pass_id if ticket.parking_pass else None,
+        )
+        
+        lines = [_EXIT_HEADER_TMPL.format_map({
+            'tid': exit_details.ticket_id,
+            'reg': exit_details.vehicle_reg,
+            'vt': exit_details.vehicle_type,
+            'entry': ticket.entry_time_str,
+            'exit': actual_exit_time.isoformat(sep=' ', timespec='seconds'),
+            'hours': exit_details.duration_hours,
+        })]
+
+        if ticket.parking_pass:
+            lines.append(f"Pass Type: {exit_details.pass_type}")
+            lines.append(f"Pass ID: {exit_details.pass_id}")
+            lines.extend(ticket.parking_pass.exit_status_lines())
+            lines.append(_DASH45)
+            lines.append(ticket.parking_pass.exit_fee_line(fee))
+        else:
+            lines.append(_EXIT_STANDARD_FEE_TMPL.format_map({
+                'strategy': exit_details.pricing_strategy,
+                'rate': exit_details.hourly_rate,
+                'fee': fee,
+            }))
+
+        lines.append(_EXIT_FOOTER_TMPL.format_map({
+            'spaces': ticket.spaces_used,
+            'available': available,
+            'total': self._total_spaces,
+        }))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        return exit_details
+    
+    def issue_monthly_pass(self, holder_name: str, vehicle_registration: str, 
+                           months: int = 1) -> MonthlyPass:
+        pass_id = self._generate_pass_id("monthly")
+        now = datetime.now()
+        expiry_date = now + timedelta(days=30 * months)
+
+        monthly_pass = MonthlyPass(pass_id, holder_name, vehicle_registration, expiry_date)
+        self._passes[pass_id] = monthly_pass
+
+        print(_NL_EQ45)
+        print("        MONTHLY PASS ISSUED")
+        print(_EQ45)
+        print(f"Pass ID: {pass_id}")
+        print(f"Holder: {holder_name}")
+        print(f"Vehicle: {vehicle_registration}")
+        print(f"Issue Date: {now.date().isoformat()}")
+        print(f"Expiry Date: {expiry_date.date().isoformat()}")
+        print(f"Days Valid: {monthly_pass.days_remaining(now)}")
+        print("Status: ACTIVE")
+        print(_EQ45_NL)
+        
+        return monthly_pass
+    
+    def issue_single_pass(self, holder_name: str, vehicle_registration: str) -> SingleEntryPass:
+        pass_id = self._generate_pass_id("single")
+        
+        single_pass = SingleEntryPass(pass_id, holder_name, vehicle_registration)
+        self._passes[pass_id] = single_pass
+        
+        print(_NL_EQ45)
+        print("       SINGLE ENTRY PASS ISSUED")
+        print(_EQ45)
+        print(f"Pass ID: {pass_id}")
+        print(f"Holder: {holder_name}")
+        print(f"Vehicle: {vehicle_registration}")
+        print("Status: VALID (Single Use)")
+        print(f"Flat Rate: ${SingleEntryPass.FLAT_RATE:.2f}")
+        print(_EQ45_NL)
+        
+        return single_pass
+    
+    def get_status(self) -> Dict:
+        return {
+            "total_spaces": self._total_spaces,
+            "occupied_spaces": self._occupied_spaces.value,
+            "available_spaces": self.get_available_spaces(),
+            "active_tickets": len(self._active_tickets),
+            "registered_passes": len(self._passes)
+        }
+
+
+# ============== ENHANCED DEMONSTRATION ==============
+
+def main():
+    print("\n" + _EQ65)
+    print("     URBAN CITY PARKING MANAGEMENT SYSTEM - DEMONSTRATION")
+    print("              (Enhanced with Simulated Time Durations)")
+    print(_EQ65)
+    
+    parking_lot = ParkingLot(300)
+    
+    status = parking_lot.get_status()
+    print(f"\nInitial Status:")
+    print(f"  Total Spaces: {status['total_spaces']}")
+    print(f"  Available: {status['available_spaces']}")
+    
+    # ===== 5.1: Vehicle Entry (No Pass) =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.1: Vehicle Entry (No Pass)")
+    print(_DASH65)
+    
+    car1 = Car("ABC-1234")
+    entry_time_1 = datetime(2025, 1, 15, 9, 30, 0)  # Wednesday 9:30 AM
+    ticket1 = parking_lot.vehicle_entry(car1, entry_time=entry_time_1, 
+                                         pricing_strategy=StandardPricing())
+    
+    # ===== 5.2: Vehicle Exit with Fee Calculation =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.2: Vehicle Exit with Fee Calculation (3.5 hours)")
+    print(_DASH65)
+    
+    exit_time_1 = datetime(2025, 1, 15, 13, 0, 0)  # Wednesday 1:00 PM
+    parking_lot.vehicle_exit(ticket1.ticket_id, exit_time=exit_time_1,
+                             pricing_strategy=StandardPricing(),
+                             simulated_duration=3.5)
+    
+    # ===== 5.3: Monthly Pass Issuance =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.3: Monthly Pass Issuance")
+    print(_DASH65)
+    
+    monthly_pass = parking_lot.issue_monthly_pass(
+        holder_name="John Smith",
+        vehicle_registration="XYZ-5678",
+        months=1
+    )
+    
+    # ===== 5.4: Entry with Monthly Pass =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.4: Entry with Monthly Pass")
+    print(_DASH65)
+    
+    car2 = Car("XYZ-5678")
+    entry_time_2 = datetime(2025, 1, 15, 14, 0, 0)
+    ticket2 = parking_lot.vehicle_entry(car2, pass_id=monthly_pass.pass_id,
+                                         entry_time=entry_time_2,
+                                         pricing_strategy=StandardPricing())
+    
+    # ===== 5.5: Exit with Monthly Pass =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.5: Exit with Monthly Pass (4.5 hours - Fee Waived)")
+    print(_DASH65)
+    
+    exit_time_2 = datetime(2025, 1, 15, 18, 30, 0)
+    parking_lot.vehicle_exit(ticket2.ticket_id, exit_time=exit_time_2,
+                             pricing_strategy=StandardPricing(),
+                             simulated_duration=4.5)
+    
+    # ===== 5.6: Peak Hour Pricing =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.6: Peak Hour Pricing (Truck, 4 hours during peak)")
+    print(_DASH65)
+    
+    truck = Truck("TRK-9999")
+    entry_time_3 = datetime(2025, 1, 13, 10, 0, 0)  # Monday 10:00 AM (Peak)
+    ticket3 = parking_lot.vehicle_entry(truck, entry_time=entry_time_3,
+                                         pricing_strategy=PeakPricing())
+    
+    exit_time_3 = datetime(2025, 1, 13, 14, 0, 0)  # Monday 2:00 PM
+    parking_lot.vehicle_exit(ticket3.ticket_id, exit_time=exit_time_3,
+                             pricing_strategy=PeakPricing(),
+                             simulated_duration=4.0)
+    
+    # ===== 5.7: Weekend Pricing =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.7: Weekend Pricing (Motorcycle, 5 hours)")
+    print(_DASH65)
+    
+    motorcycle = Motorcycle("MTR-1111")
+    entry_time_4 = datetime(2025, 1, 18, 11, 0, 0)  # Saturday 11:00 AM
+    ticket4 = parking_lot.vehicle_entry(motorcycle, entry_time=entry_time_4,
+                                         pricing_strategy=WeekendPricing())
+    
+    exit_time_4 = datetime(2025, 1, 18, 16, 0, 0)  # Saturday 4:00 PM
+    parking_lot.vehicle_exit(ticket4.ticket_id, exit_time=exit_time_4,
+                             pricing_strategy=WeekendPricing(),
+                             simulated_duration=5.0)
+    
+    # ===== 5.8: Single Entry Pass Usage =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.8: Single Entry Pass Usage (6 hours - Flat Rate)")
+    print(_DASH65)
+    
+    single_pass = parking_lot.issue_single_pass(
+        holder_name="Jane Doe",
+        vehicle_registration="SGL-2222"
+    )
+    
+    car3 = Car("SGL-2222")
+    entry_time_5 = datetime(2025, 1, 15, 8, 0, 0)
+    ticket5 = parking_lot.vehicle_entry(car3, pass_id=single_pass.pass_id,
+                                         entry_time=entry_time_5,
+                                         pricing_strategy=StandardPricing())
+    
+    exit_time_5 = datetime(2025, 1, 15, 14, 0, 0)
+    parking_lot.vehicle_exit(ticket5.ticket_id, exit_time=exit_time_5,
+                             pricing_strategy=StandardPricing(),
+                             simulated_duration=6.0)
+    
+    # ===== 5.9: Parking Lot Full Scenario =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.9: Parking Lot Full (Entry Denied)")
+    print(_DASH65)
+    
+    # Simulate lot being full
+    parking_lot.set_occupied_spaces(300)
+    print(f"[Simulating full parking lot: {parking_lot.get_available_spaces()} spaces available]")
+    
+    car4 = Car("NEW-0001")
+    parking_lot.vehicle_entry(car4, pricing_strategy=StandardPricing())
+    
+    # Reset for next demo
+    parking_lot.set_occupied_spaces(0)
+    
+    # ===== 5.10: Invalid Pass Attempt =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.10: Invalid Pass Attempt")
+    print(_DASH65)
+    
+    car5 = Car("INV-0000")
+    entry_time_6 = datetime(2025, 1, 15, 9, 0, 0)
+    ticket6 = parking_lot.vehicle_entry(car5, pass_id="INVALID-001",
+                                         entry_time=entry_time_6,
+                                         pricing_strategy=StandardPricing())
+    
+    exit_time_6 = datetime(2025, 1, 15, 11, 0, 0)
+    parking_lot.vehicle_exit(ticket6.ticket_id, exit_time=exit_time_6,
+                             pricing_strategy=StandardPricing(),
+                             simulated_duration=2.0)
+    
+    # ===== 5.11: Bulk Fee Projection =====
+    print("\n" + _DASH65)
+    print("SCENARIO 5.11: Bulk Fee Projection (all active tickets, one sweep)")
+    print(_DASH65)
+
+    bulk_entry_time = datetime(2025, 1, 15, 9, 0, 0)
+    car6 = Car("BLK-0001")
+    ticket7 = parking_lot.vehicle_entry(car6, entry_time=bulk_entry_time,
+                                         pricing_strategy=StandardPricing())
+
+    car7 = Car("XYZ-5678")
+    ticket8 = parking_lot.vehicle_entry(car7, pass_id=monthly_pass.pass_id,
+                                         entry_time=bulk_entry_time,
+                                         pricing_strategy=StandardPricing())
+
+    single_pass_2 = parking_lot.issue_single_pass(
+        holder_name="Sam Perera",
+        vehicle_registration="BLK-0003"
+    )
+
+    truck2 = Truck("BLK-0003")
+    ticket9 = parking_lot.vehicle_entry(truck2, pass_id=single_pass_2.pass_id,
+                                         entry_time=bulk_entry_time,
+                                         pricing_strategy=StandardPricing())
+
+    projection_time = datetime(2025, 1, 15, 12, 0, 0)  # 3 hours later
+    projected_fees = parking_lot.bulk_calculate_fees(
+        now=projection_time, pricing_strategy=StandardPricing())
+
+    print(f"Projected fees at {projection_time.isoformat(sep=' ', timespec='seconds')}:")
+    for ticket in (ticket7, ticket8, ticket9):
+        print(f"  {ParkingLot._format_ticket_id(ticket.ticket_id)}: "
+              f"${projected_fees[ticket.ticket_id]:.2f}")
+
+    for ticket in (ticket7, ticket8, ticket9):
+        parking_lot.vehicle_exit(ticket.ticket_id, exit_time=projection_time,
+                                 pricing_strategy=StandardPricing(),
+                                 simulated_duration=3.0)
+
+    # ===== FINAL STATUS =====
+    print("\n" + _DASH65)
+    print("FINAL STATUS")
+    print(_DASH65)
+    status = parking_lot.get_status()
+    print(f"  Total Spaces: {status['total_spaces']}")
+    print(f"  Occupied: {status['occupied_spaces']}")
+    print(f"  Available: {status['available_spaces']}")
+    print(f"  Active Tickets: {status['active_tickets']}")
+    print(f"  Registered Passes: {status['registered_passes']}")
+    
+    print("\n" + _EQ65)
+    print("                   DEMONSTRATION COMPLETE")
+    print(_EQ65 + "\n")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file